@@ -0,0 +1,42 @@
+"""Numeric inner-loop kernels for series with float coefficients.
+
+The kernels are compiled with numba when it is installed; otherwise the
+plain Python definitions run as-is, so numba stays an optional dependency.
+"""
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        def decorate(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return decorate
+
+
+@njit(cache=True, fastmath=True)
+def conv_coef(a, b, n, o1, o2):
+    """Return the coefficient of z^n of the product of two finite-support series.
+
+    a and b are float arrays of coefficients starting at orders o1 and o2.
+    """
+    s = 0.0
+    for i in range(o1, n - o2 + 1):
+        s += a[i - o1] * b[n - i - o2]
+    return s
+
+
+@njit(cache=True)
+def inverse_series(a, out):
+    """Fill out with the first out.size coefficients of the inverse of a.
+
+    a is a float array of coefficients of an order-zero series, a[0] != 0.
+    """
+    n = out.size
+    out[0] = 1.0 / a[0]
+    for k in range(1, n):
+        s = 0.0
+        for i in range(k):
+            s += out[i] * a[k - i]
+        out[k] = -s / a[0]
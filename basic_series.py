@@ -1,49 +1,113 @@
-import math
-from power_series import PowerSeries, verbose_multiplication
-from fractions import Fraction
+from functools import lru_cache, wraps
+from power_series import PowerSeries, verbose_multiplication, _Q, _np
 
+
+def _interned(constructor):
+    """Intern constructor results, handing out a fresh view per call.
+
+    Each view shares the interned instance's coefficient caches but carries
+    its own display length, so set_length on one call's result does not
+    leak into later calls.
+    """
+    cached = lru_cache(maxsize=None)(constructor)
+    @wraps(constructor)
+    def fresh_view(*args, **kwargs):
+        interned = cached(*args, **kwargs)
+        view = PowerSeries.__new__(PowerSeries)
+        view.__dict__.update(interned.__dict__)
+        view.length = 5
+        return view
+    return fresh_view
+
+
+# Sign of the z^n term, indexed by n & 3 (trigonometric) or n & 1 (hyperbolic).
+_SIGN_SIN = (0, 1, 0, -1)
+_SIGN_COS = (1, 0, -1, 0)
+_SIGN_SINH = (0, 1)
+_SIGN_COSH = (1, 0)
+
+@_interned
 def zero() -> PowerSeries:
     return PowerSeries(lambda n:0, order=None)
 
+@_interned
 def one() -> PowerSeries:
-    return PowerSeries(lambda n:1*(n==0), order=0)
+    series = PowerSeries(lambda n:1*(n==0), order=0)
+    series.integer_coefs = True
+    series.support = range(0, 1)
+    return series
 
+@_interned
 def monomial(degree: int, coef :int = 1) -> PowerSeries:
     if coef == 0:
         return zero()
-    return PowerSeries(lambda n: coef*(n==degree), order=degree)
+    series = PowerSeries(lambda n: coef*(n==degree), order=degree)
+    series.integer_coefs = True
+    series.support = range(degree, degree + 1)
+    return series
 
+@_interned
 def geometric(a: int = 1) -> PowerSeries:
     if a == 0:
         return one()
-    return PowerSeries(lambda n:a**n)
+    series = PowerSeries(lambda n:a**n, order=0)
+    series.integer_coefs = True
+    return series
+
+def power_over_factorial(a: int):
+    """Return the function n -> a**n/n!, computed incrementally via c_n = c_(n-1)*a/n."""
+    values = [_Q(1)]
+    def term(n):
+        while len(values) <= n:
+            values.append(values[-1] * _Q(a, len(values)))
+        return values[n]
+    return term
 
+@_interned
 def exponential(a: int = 1) -> PowerSeries:
     if a == 0:
         return one()
-    return PowerSeries(lambda n: Fraction(a**n, math.factorial(n)))
+    return PowerSeries(power_over_factorial(a), order=0)
 
+@_interned
 def sine(a: int = 1) -> PowerSeries:
     if a == 0:
         return zero()
-    return PowerSeries(lambda n: (1*(n%4==1)-1*(n%4==3))*Fraction(a**n, math.factorial(n)), order=1)
+    return PowerSeries(lambda n, term=power_over_factorial(a): _SIGN_SIN[n & 3]*term(n), order=1)
 
+@_interned
 def cosine(a: int = 1) -> PowerSeries:
     if a == 0:
         return one()
-    return PowerSeries(lambda n: (1*(n%4==0)-1*(n%4==2))*Fraction(a**n, math.factorial(n)))
+    return PowerSeries(lambda n, term=power_over_factorial(a): _SIGN_COS[n & 3]*term(n), order=0)
 
+@_interned
 def sineh(a: int = 1) -> PowerSeries:
     if a == 0:
         return zero()
-    return PowerSeries(lambda n: 1*(n%2==1)*Fraction(a**n, math.factorial(n)), order=1)
+    return PowerSeries(lambda n, term=power_over_factorial(a): _SIGN_SINH[n & 1]*term(n), order=1)
 
+@_interned
 def cosineh(a: int = 1) -> PowerSeries:
     if a == 0:
         return one()
-    return PowerSeries(lambda n: 1*(n%2==0)*Fraction(a**n, math.factorial(n)))
+    return PowerSeries(lambda n, term=power_over_factorial(a): _SIGN_COSH[n & 1]*term(n), order=0)
 
 def polynomial(coefs: list[int]) -> PowerSeries:
     if not coefs:
         return zero()
-    return PowerSeries(lambda n: sum([coefs[i]*(n==i) for i in range(len(coefs))]))
\ No newline at end of file
+    coefs = list(coefs)
+    for order, coef in enumerate(coefs):
+        if coef != 0:
+            break
+    else:
+        return zero()
+    series = PowerSeries(lambda n: coefs[n] if n < len(coefs) else 0, order=order)
+    series.poly_coefs = coefs
+    series.support = range(order, len(coefs))
+    if any(isinstance(coef, float) for coef in coefs):
+        if _np is not None:
+            series.float_coefs = _np.asarray(coefs[series.order:], dtype=_np.float64)
+    elif all(isinstance(coef, int) for coef in coefs):
+        series.integer_coefs = True
+    return series
\ No newline at end of file
@@ -1,6 +1,27 @@
+import math
 from fractions import Fraction
 from typing import Callable
 
+try:
+    # gmpy2 offers GMP-backed rationals with the same semantics as Fraction;
+    # use them in the arithmetic hot paths when available.
+    from gmpy2 import mpq as _Q
+except ImportError:
+    _Q = Fraction
+
+try:
+    # NumPy is optional; when present, products of integer-coefficient
+    # series are computed as vectorized dot products.
+    import numpy as _np
+except ImportError:
+    _np = None
+
+from _kernels import conv_coef, inverse_series
+
+# Sentinel distinguishing "order not provided" from the explicit order=None
+# of the zero series.
+_UNSET = object()
+
 
 class PowerSeries:
     """This class implements Laurent power series with rational coefficients.
@@ -12,33 +33,58 @@ class PowerSeries:
 
     Args:
         coefficient_formula (Callable[[int], Fraction]): the function n -> c_n that defines the coefficients of the power series.
-        order (int, optional): the order of the power series at zero. Defaults to 0. Is mandatory for series of negative order.
+        order (int | None, optional): the order of the power series at zero. When given it is trusted as-is
+            (None meaning the zero series); when omitted it is determined by probing the first coefficients.
+            Is mandatory for series of negative order.
 
     Attributes:
         formula (Callable[[int], Fraction]): the function n -> c_n that defines the coefficients of the power series.
         order (int | None): the order of the power series at zero. The zero series has order None.
         length (int): the number of terms to output on the string representation of the series. Defaults to 5.
+        integer_coefs (bool): whether all coefficients are known to be integers. Enables faster multiplication.
+        poly_coefs (list | None): full coefficient list when the series is a known polynomial. Enables evaluation.
+        float_coefs (ndarray | None): float coefficients, starting at the order, of a known finite-support series. Enables compiled kernels.
+        support (range | None): range of degrees outside which all coefficients are known to be zero. Enables sparse multiplication.
 
     Methods:
         set_length: change the value of self.length.
         get_order: internal - determine self.order during __init__.
         term: internal - build each term for string representation.
+        truncate: return the first coefficients of the series as a list.
+        evaluate: evaluate a known polynomial series at a point.
         times_nth: internal - build one term for multiplication of series.
         invertible_factor: internal - factor out powers of z to get an invertible series.
         inverse_nth: internal - build one term for computing inverse.
         inverse: return inverse power series.
     """
 
-    def __init__(self, coefficient_formula: Callable[[int], Fraction], order: int = 0) -> None:
+    def __init__(self, coefficient_formula: Callable[[int], Fraction], order: int | None = _UNSET) -> None:
         self.formula = coefficient_formula
-        self.order = order
+        self.order = 0 if order is _UNSET else order
         self.length = 5
-        if not self.order or self.order >= 0:
+        self.integer_coefs = False
+        self.poly_coefs = None
+        self.float_coefs = None
+        self.support = None
+        # Dense coefficient storage, extended lazily from the first degree
+        # the series can be nonzero at; index k holds the coefficient of
+        # z^(_coefs_base + k).
+        self._coefs: list[Fraction] = []
+        self._coefs_base = self.order if isinstance(self.order, int) else 0
+        self._inv_cache: list[Fraction] = []
+        self._inv_factor = None
+        self._a0_inv = None
+        self._np_cache = None
+        if order is _UNSET:
             self.get_order()
 
     def __call__(self, n: int) -> Fraction:
         """Return coefficient of z^n in power series expansion.
 
+        Coefficients are stored in a dense list extended lazily on first
+        access, so repeated requests for the same degree are plain list
+        indexing and never re-invoke the coefficient formula.
+
         Args:
             n (int): degree of target monomial.
 
@@ -46,9 +92,33 @@ class PowerSeries:
             Fraction: coefficient of target monomial.
         """
         if self.order == None or n < self.order:
-            return Fraction(0)
-        else:
-            return Fraction(self.formula(n))
+            return _Q(0)
+        coefs = self._coefs
+        k = n - self._coefs_base
+        if k < len(coefs):
+            return coefs[k]
+        base = self._coefs_base
+        formula = self.formula
+        target_value = None
+        if k > len(coefs):
+            # Jump well past the cached prefix: evaluate the target degree
+            # first, so formulas with bulk fast paths of their own (such as
+            # inverse_nth's Newton iteration) can fill everything in one
+            # shot; the intermediate degrees below then hit their caches.
+            target_value = formula(n)
+        while len(coefs) <= k:
+            if len(coefs) == k and target_value is not None:
+                value = target_value
+            else:
+                value = formula(base + len(coefs))
+            # Float coefficients stay floats, already-rational values are
+            # stored as-is; only other exact values are wrapped.
+            if isinstance(value, float):
+                value = float(value)
+            elif type(value) is not _Q:
+                value = _Q(value)
+            coefs.append(value)
+        return coefs[k]
 
     def set_length(self, n: int) -> None:
         """Set number of terms displayed when printing this power series. Default is 5.
@@ -59,12 +129,22 @@ class PowerSeries:
         self.length = n
         return
 
-    def get_order(self) -> None:
+    def get_order(self, start: int = 0) -> None:
         """Internal method to determine the order of the power series.
         After a number of zeroes (default: 11) it assumes the series is the zero series.
+
+        Probes the formula directly, skipping __call__'s wrapping and caching;
+        the common case of a nonzero constant term returns after one call.
+
+        Args:
+            start (int, optional): lowest degree the series can be nonzero at. Defaults to 0.
         """
-        for i in range(11):
-            if self(i) != 0:
+        formula = self.formula
+        if formula(start) != 0:
+            self.order = start
+            return
+        for i in range(start + 1, start + 11):
+            if formula(i) != 0:
                 self.order = i
                 return
         self.order = None
@@ -76,15 +156,27 @@ class PowerSeries:
         Args:
             n (int): degree of the monomial.
 
+        Returns:
+            str: monomial as a string.
+        """
+        return self._term_with(n, self(n))
+
+    def _term_with(self, n: int, value: Fraction) -> str:
+        """Internal method building the monomial string for an already-computed coefficient.
+
+        Args:
+            n (int): degree of the monomial.
+            value (Fraction): coefficient of the monomial.
+
         Returns:
             str: monomial as a string.
         """
         if n == 0:
-            return '%s' % (self(n),)
+            return '%s' % (value,)
         elif n == 1:
-            return '(%s)z' % (self(n),)
+            return '(%s)z' % (value,)
         else:
-            return '(%s)z^%s' % (self(n), n)
+            return '(%s)z^%s' % (value, n)
 
     def first_terms(self, length: int, show_zeros: bool = False) -> str:
         """Outputs first length terms of the power series as a string.
@@ -98,11 +190,13 @@ class PowerSeries:
         """
         if self.order == None:
             return '0'
+        values = [self(i + self.order) for i in range(length)]
         if show_zeros:
-            terms = [self.term(i + self.order) for i in range(length)]
+            terms = [self._term_with(i + self.order, value)
+                    for i, value in enumerate(values)]
         else:
-            terms = [self.term(i + self.order)
-                    for i in range(length) if self(i + self.order) != 0]
+            terms = [self._term_with(i + self.order, value)
+                    for i, value in enumerate(values) if value != 0]
         if not terms:
             return '0'
         else:
@@ -116,6 +210,48 @@ class PowerSeries:
         """
         return self.first_terms(length=self.length)
 
+    def truncate(self, length: int) -> list[Fraction]:
+        """Return the first length coefficients of the series as a list.
+
+        Coefficients start at degree self.order (degree 0 for the zero series).
+
+        Args:
+            length (int): number of coefficients to return.
+
+        Returns:
+            list[Fraction]: coefficients of z^order up to z^(order + length - 1).
+        """
+        if self.order == None:
+            return [_Q(0)] * length
+        if length > 0:
+            # Request the last coefficient first so bulk fast paths can
+            # fill the whole prefix at once instead of degree by degree.
+            self(self.order + length - 1)
+        return [self(self.order + i) for i in range(length)]
+
+    def evaluate(self, z: Fraction) -> Fraction:
+        """Evaluate the series at the point z. Only possible for a known polynomial series.
+
+        Uses the Horner scheme on the stored coefficient list.
+
+        Args:
+            z (Fraction): point at which to evaluate.
+
+        Raises:
+            ValueError: if the series is not a known polynomial.
+
+        Returns:
+            Fraction: value of the polynomial at z.
+        """
+        if self.order == None:
+            return _Q(0)
+        if self.poly_coefs == None:
+            raise ValueError('Series is not a known polynomial')
+        result = _Q(0)
+        for coef in reversed(self.poly_coefs):
+            result = result * z + coef
+        return result
+
     def __neg__(self) -> 'PowerSeries':
         """Obtain additive inverse of self.
 
@@ -134,23 +270,40 @@ class PowerSeries:
             PowerSeries: self plus other.
         """
         if self.order == None:
-            sum_order = other.order
-        elif other.order == None:
-            sum_order = self.order
-        else:
-            sum_order = min(self.order, other.order)
-        return PowerSeries(lambda n: self(n) + other(n), order=sum_order)
+            return other
+        if other.order == None:
+            return self
+        sum_order = min(self.order, other.order)
+        result = PowerSeries(lambda n, first=self, second=other: first(n) + second(n),
+                             order=sum_order)
+        # min(...) is only a lower bound: leading terms may cancel, so probe
+        # for the true order starting from it.
+        result.get_order(start=sum_order)
+        return result
 
     def __sub__(self, other: 'PowerSeries') -> 'PowerSeries':
         """Substract a given power series from self.
 
+        Fused into a single series instead of self + (-other), so no
+        intermediate negated series is constructed.
+
         Args:
             other (PowerSeries): power series to substract.
 
         Returns:
             PowerSeries: self minus other.
         """
-        return self + (-other)
+        if self.order == None:
+            return -other
+        if other.order == None:
+            return self
+        sub_order = min(self.order, other.order)
+        result = PowerSeries(lambda n, first=self, second=other: first(n) - second(n),
+                             order=sub_order)
+        # min(...) is only a lower bound: leading terms may cancel, so probe
+        # for the true order starting from it.
+        result.get_order(start=sub_order)
+        return result
 
     def times_nth(self, other: 'PowerSeries', n: int) -> Fraction:
         """Return the coefficient of z^n in expansion of self*other.
@@ -162,15 +315,75 @@ class PowerSeries:
         Returns:
             Fraction: coefficient of target monomial in product.
         """
-        if self.order == None or other.order == None:
-            return Fraction(0)
-        terms = [self(i) * other(n-i)
-                 for i in range(self.order, - other.order + n + 1)]
-        return sum(terms)
+        self_order = self.order
+        other_order = other.order
+        if self_order == None or other_order == None:
+            return _Q(0)
+        self_coef = self.__call__
+        other_coef = other.__call__
+        self_support = self.support
+        total = _Q(0)
+        if other.support is not None:
+            # Only the degrees in other's finite support can contribute.
+            for j in other.support:
+                i = n - j
+                if i < self_order:
+                    continue
+                if self_support is not None and i not in self_support:
+                    continue
+                total += self_coef(i) * other_coef(j)
+            return total
+        if self_support is not None:
+            for i in self_support:
+                if i >= self_order and n - i >= other_order:
+                    total += self_coef(i) * other_coef(n-i)
+            return total
+        for i in range(self_order, - other_order + n + 1):
+            total += self_coef(i) * other_coef(n-i)
+        return total
+
+    def _np_coefs(self, length: int) -> '_np.ndarray':
+        """Internal method returning the first length coefficients, starting at self.order, as a NumPy array.
+
+        The array is cached and regrown as longer prefixes are requested.
+        Coefficients are stored as Python ints (object dtype) to avoid overflow.
+
+        Args:
+            length (int): number of coefficients to materialise.
+
+        Returns:
+            _np.ndarray: array of the first length coefficients.
+        """
+        if self._np_cache is None or len(self._np_cache) < length:
+            self._np_cache = _np.asarray(
+                [int(self(self.order + i)) for i in range(length)], dtype=object)
+        return self._np_cache
+
+    def _float_prefix(self, length: int) -> '_np.ndarray':
+        """Internal method returning self.float_coefs zero-padded to at least length entries.
+
+        Valid because float_coefs describes a finite-support series: all
+        coefficients past the stored prefix are exactly zero.
+
+        Args:
+            length (int): minimum number of entries required.
+
+        Returns:
+            _np.ndarray: padded float coefficient array.
+        """
+        if len(self.float_coefs) < length:
+            padded = _np.zeros(length)
+            padded[:len(self.float_coefs)] = self.float_coefs
+            self.float_coefs = padded
+        return self.float_coefs
 
     def __mul__(self, other: 'PowerSeries') -> 'PowerSeries':
         """Multiply a given power series with self.
 
+        When both factors have integer coefficients and NumPy is available,
+        each product coefficient is computed as a vectorized dot product of
+        coefficient prefixes instead of a Python-level loop.
+
         Args:
             other (PowerSeries): power series to multiply.
 
@@ -179,7 +392,29 @@ class PowerSeries:
         """
         if self.order == None or other.order == None:
             return PowerSeries(lambda n: 0, order=None)
-        return PowerSeries(lambda n: self.times_nth(other, n), order=self.order + other.order)
+        product_order = self.order + other.order
+        if (_np is not None and self.float_coefs is not None
+                and other.float_coefs is not None):
+            def float_formula(n, first=self, second=other):
+                length = n - first.order - second.order + 1
+                return conv_coef(first._float_prefix(length),
+                                 second._float_prefix(length),
+                                 n, first.order, second.order)
+            product = PowerSeries(float_formula, order=product_order)
+        elif _np is not None and self.integer_coefs and other.integer_coefs:
+            def formula(n, first=self, second=other):
+                length = n - first.order - second.order + 1
+                a = first._np_coefs(length)
+                b = second._np_coefs(length)
+                return int(_np.dot(a[:length], b[length - 1::-1]))
+            product = PowerSeries(formula, order=product_order)
+            product.integer_coefs = True
+        else:
+            product = PowerSeries(lambda n: self.times_nth(other, n), order=product_order)
+        if self.support is not None and other.support is not None:
+            product.support = range(self.support.start + other.support.start,
+                                    self.support.stop + other.support.stop - 1)
+        return product
 
     def invertible_factor(self) -> 'PowerSeries':
         """Returns series with the term z^(order) factored out; the invertible part of the preparation factorisation.
@@ -192,7 +427,11 @@ class PowerSeries:
         """
         if self.order == None:
             raise ValueError('Zero not invertible')
-        return self * PowerSeries(lambda n: 1*(n == -self.order), order=-self.order)
+        if self._inv_factor is None:
+            shift = PowerSeries(lambda n, d=-self.order: 1*(n == d), order=-self.order)
+            shift.support = range(-self.order, -self.order + 1)
+            self._inv_factor = self * shift
+        return self._inv_factor
 
     def inverse_nth(self, n: int) -> Fraction:
         """Returns nth coefficient of the inverse of series divided by z^(order). Internal method needed to compute the inverse.
@@ -208,12 +447,42 @@ class PowerSeries:
         """
         if self.order == None:
             raise ValueError('Division by zero')
+        cache = self._inv_cache
+        if n < len(cache):
+            return cache[n]
+        if _np is not None and self.float_coefs is not None:
+            # Grow the computed prefix geometrically so one-degree-at-a-time
+            # requests rerun the quadratic kernel only O(log n) times.
+            target = max(n + 1, 2 * len(cache))
+            inv_factor = self.invertible_factor()
+            coefs = _np.asarray([float(inv_factor(i)) for i in range(target)])
+            out = _np.empty(target)
+            inverse_series(coefs, out)
+            self._inv_cache = [float(c) for c in out]
+            return self._inv_cache[n]
         inv_factor = self.invertible_factor()
-        if n == 0:
-            return 1 / inv_factor(0)
-        else:
-            terms = [self.inverse_nth(i)*inv_factor(n-i) for i in range(n)]
-            return - sum(terms) / inv_factor(0)
+        if n + 1 >= _NEWTON_CUTOFF and n + 1 >= 2 * len(cache):
+            # A large jump in requested precision: refill the whole prefix
+            # with Newton iteration instead of extending term by term.
+            # Newton's truncated products are exact-only, so leave float
+            # coefficients (possible without NumPy) to the recurrence below.
+            leading = inv_factor.truncate(n + 1)
+            if not any(isinstance(c, float) for c in leading):
+                self._inv_cache = _newton_inverse(leading, n + 1)
+                return self._inv_cache[n]
+        if self._a0_inv is None:
+            self._a0_inv = _Q(1) / inv_factor(0)
+        a0_inv = self._a0_inv
+        while len(cache) <= n:
+            k = len(cache)
+            if k == 0:
+                cache.append(a0_inv)
+            else:
+                total = _Q(0)
+                for i in range(k):
+                    total += cache[i] * inv_factor(k - i)
+                cache.append(-total * a0_inv)
+        return cache[n]
 
     def inverse(self) -> 'PowerSeries':
         """Returns the inverse of the power series.
@@ -226,7 +495,9 @@ class PowerSeries:
         """
         if self.order == None:
             raise ValueError('Division by zero')
-        return PowerSeries(lambda n: self.inverse_nth(n)) * PowerSeries(lambda n: 1*(n == -self.order), -self.order)
+        shift = PowerSeries(lambda n, d=-self.order: 1*(n == d), order=-self.order)
+        shift.support = range(-self.order, -self.order + 1)
+        return PowerSeries(lambda n: self.inverse_nth(n)) * shift
 
     def __truediv__(self, other: 'PowerSeries') -> 'PowerSeries':
         """Divide self by a given series.
@@ -240,6 +511,174 @@ class PowerSeries:
         return self * other.inverse()
 
 
+# Below the Karatsuba cutoff the schoolbook product is faster; above the FFT
+# cutoff (and within float64 precision) NumPy FFT convolution is used instead.
+# Inversion switches from the quadratic recurrence to Newton iteration once
+# at least _NEWTON_CUTOFF coefficients are wanted at once.
+_KARATSUBA_CUTOFF = 32
+_FFT_CUTOFF = 64
+_NEWTON_CUTOFF = 32
+
+
+def _schoolbook_product(xs: list, ys: list) -> list:
+    """Internal: full O(n*m) convolution of two coefficient lists."""
+    if not xs or not ys:
+        return []
+    out = [0] * (len(xs) + len(ys) - 1)
+    for i, x in enumerate(xs):
+        if x:
+            for j, y in enumerate(ys):
+                out[i + j] += x * y
+    return out
+
+
+def _karatsuba_product(xs: list, ys: list) -> list:
+    """Internal: full convolution of two coefficient lists by Karatsuba splitting."""
+    if len(xs) < len(ys):
+        xs = xs + [0] * (len(ys) - len(xs))
+    elif len(ys) < len(xs):
+        ys = ys + [0] * (len(xs) - len(ys))
+    n = len(xs)
+    if n <= _KARATSUBA_CUTOFF:
+        return _schoolbook_product(xs, ys)
+    half = n // 2
+    x0, x1 = xs[:half], xs[half:]
+    y0, y1 = ys[:half], ys[half:]
+    low = _karatsuba_product(x0, y0)
+    high = _karatsuba_product(x1, y1)
+    xsum = [a + b for a, b in zip(x0 + [0] * (n - 2 * half), x1)]
+    ysum = [a + b for a, b in zip(y0 + [0] * (n - 2 * half), y1)]
+    mid = _karatsuba_product(xsum, ysum)
+    out = [0] * (2 * n - 1)
+    for i, c in enumerate(low):
+        out[i] += c
+        out[i + half] -= c
+    for i, c in enumerate(high):
+        out[i + 2 * half] += c
+        out[i + half] -= c
+    for i, c in enumerate(mid):
+        out[i + half] += c
+    return out
+
+
+def _fft_int_product(xs: list[int], ys: list[int]) -> list[int]:
+    """Internal: full convolution of two integer lists via NumPy real FFT."""
+    size = 1
+    while size < len(xs) + len(ys) - 1:
+        size *= 2
+    fx = _np.fft.rfft(_np.asarray(xs, dtype=_np.float64), size)
+    fy = _np.fft.rfft(_np.asarray(ys, dtype=_np.float64), size)
+    conv = _np.fft.irfft(fx * fy, size)[:len(xs) + len(ys) - 1]
+    return [int(round(c)) for c in conv]
+
+
+def _int_product(xs: list[int], ys: list[int]) -> list[int]:
+    """Internal: full convolution of two integer lists.
+
+    Uses FFT convolution when NumPy is available, both lists are long
+    enough and the result provably fits in exact float64 arithmetic;
+    falls back to Karatsuba otherwise.
+    """
+    if _np is not None and min(len(xs), len(ys)) >= _FFT_CUTOFF:
+        bound = (max(map(abs, xs), default=0) * max(map(abs, ys), default=0)
+                 * min(len(xs), len(ys)))
+        size = 1
+        while size < len(xs) + len(ys) - 1:
+            size *= 2
+        # The coefficient bound alone is not enough: FFT roundoff grows
+        # roughly like size*log2(size)*2**-53 relative to it, so require
+        # the accumulated error to stay well inside the 0.5 rounding margin.
+        if bound * size * math.log2(size) * 2.0 ** -53 < 0.25:
+            return _fft_int_product(xs, ys)
+    return _karatsuba_product(xs, ys)
+
+
+def _rational_product(xs: list[Fraction], ys: list[Fraction]) -> list[Fraction]:
+    """Internal: full convolution of two rational coefficient lists.
+
+    Factors out a common denominator from each list so the bulk of the
+    work is an integer convolution, then rebuilds rationals.
+    """
+    denom_x = math.lcm(*(x.denominator for x in xs)) if xs else 1
+    denom_y = math.lcm(*(y.denominator for y in ys)) if ys else 1
+    num_x = [int(x * denom_x) for x in xs]
+    num_y = [int(y * denom_y) for y in ys]
+    denom = denom_x * denom_y
+    return [_Q(c, denom) for c in _int_product(num_x, num_y)]
+
+
+def _mul_trunc(xs: list[Fraction], ys: list[Fraction], length: int) -> list[Fraction]:
+    """Internal: first length coefficients of the product of two coefficient lists."""
+    out = _rational_product(xs[:length], ys[:length])[:length]
+    if len(out) < length:
+        out.extend([_Q(0)] * (length - len(out)))
+    return out
+
+
+def _newton_inverse(coefs: list[Fraction], length: int) -> list[Fraction]:
+    """Internal: first length coefficients of the inverse of an order-zero series.
+
+    Doubles the known precision each step via the Newton iteration
+    b -> b*(2 - a*b), so the total cost is a few fast truncated products
+    instead of the quadratic term-by-term recurrence.
+
+    Args:
+        coefs (list[Fraction]): leading coefficients of the series, coefs[0] != 0.
+        length (int): number of inverse coefficients to produce.
+
+    Returns:
+        list[Fraction]: first length coefficients of the inverse.
+    """
+    inverse = [_Q(1) / coefs[0]]
+    precision = 1
+    while precision < length:
+        precision = min(2 * precision, length)
+        approx = _mul_trunc(coefs, inverse, precision)
+        correction = [-c for c in approx]
+        correction[0] += 2
+        inverse = _mul_trunc(inverse, correction, precision)
+    return inverse
+
+
+def mul_truncated(series1: PowerSeries, series2: PowerSeries, length: int) -> list[Fraction]:
+    """Return the first length coefficients of series1*series2 as a list.
+
+    Computes all requested coefficients of the product at once with a fast
+    convolution (FFT or Karatsuba) instead of the quadratic term-by-term
+    product, which is faster when many coefficients are needed.
+    Coefficients start at the order of the product. When either factor has
+    float coefficients the result is a float convolution.
+
+    Args:
+        series1 (PowerSeries): first factor.
+        series2 (PowerSeries): second factor.
+        length (int): number of coefficients to return.
+
+    Returns:
+        list[Fraction]: first length coefficients of the product.
+    """
+    if length <= 0:
+        return []
+    if series1.order == None or series2.order == None:
+        return [_Q(0)] * length
+    xs = series1.truncate(length)
+    ys = series2.truncate(length)
+    if (any(isinstance(x, float) for x in xs)
+            or any(isinstance(y, float) for y in ys)):
+        xs = [float(x) for x in xs]
+        ys = [float(y) for y in ys]
+        if _np is not None:
+            product = [float(c) for c in _np.convolve(xs, ys)]
+        else:
+            product = _schoolbook_product(xs, ys)
+    elif series1.integer_coefs and series2.integer_coefs:
+        product = [_Q(c) for c in _int_product([int(x) for x in xs],
+                                               [int(y) for y in ys])]
+    else:
+        product = _rational_product(xs, ys)
+    return product[:length]
+
+
 def verbose_multiplication(series1: PowerSeries, series2: PowerSeries, n: int) -> None:
     """Print a string showing the calculations to obtain the nth coefficient of series1*series2.
 